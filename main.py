@@ -1,8 +1,12 @@
 import discord
 from discord.ext import commands
-import json
+import orjson
 import os
 import logging
+import asyncio
+import time
+from collections import OrderedDict, deque
+from itertools import islice
 from datetime import datetime
 
 # Configure logging
@@ -26,18 +30,85 @@ intents.bans = True       # Required to receive ban events and manage bans
 intents.guilds = True     # Required to access guild (server) information
 intents.message_content = True  # Required to read command messages
 
+# Bot subclass that loads persisted state before connecting and finishes
+# pending disk writes before disconnecting
+class BanSyncBot(commands.Bot):
+    async def setup_hook(self):
+        """
+        Load persisted state once, before the gateway connects
+        
+        Running here rather than in on_ready means no command can be
+        dispatched before the state exists, and reconnects never reload it.
+        """
+        await load_bot_state()
+    
+    async def close(self):
+        """
+        Flush queued writes, then shut the bot down
+        """
+        # A failed flush must not keep the bot from disconnecting
+        try:
+            await flush_pending_writes()
+        except Exception:
+            logger.exception("Failed to flush pending writes on shutdown")
+        finally:
+            await super().close()
+
 # Initialize the bot with command prefix and permissions
-bot = commands.Bot(command_prefix='!', intents=intents)
+bot = BanSyncBot(command_prefix='!', intents=intents)
+
+# In-memory copy of the sync networks, loaded once in setup_hook()
+# Commands read and mutate this dict directly instead of re-reading the JSON file
+bot.networks = None
+
+# Reverse index of guild ID -> names of the networks that guild belongs to
+# Kept in sync with bot.networks so membership lookups don't scan every network
+bot.guild_to_networks = {}
+
+# Caps how many remote bans are in flight at once across all syncban commands
+# Keeps large networks from bursting into Discord's rate limits
+MAX_CONCURRENT_BANS = 10
+
+# Most recent ban records, oldest first, seeded from the log in setup_hook()
+# ban_history is served from here without touching the disk
+BAN_LOG_TAIL_SIZE = 256
+bot.recent_bans = deque(maxlen=BAN_LOG_TAIL_SIZE)
 
 # Data storage file paths
 # These JSON files store persistent data across bot restarts
 SYNC_NETWORKS_FILE = "sync_networks.json"  # Stores network configurations and memberships
-BAN_LOG_FILE = "ban_log.json"              # Stores history of all synchronized bans
+BAN_LOG_FILE = "ban_log.jsonl"             # Append-only history of all synchronized bans, one JSON object per line
+LEGACY_BAN_LOG_FILE = "ban_log.json"       # Pre-JSONL ban log, migrated on first start
+
+# Display names of recently banned users, most recently used last
+# Re-issued bans and mass bans of the same IDs skip the fetch_user round-trip
+USER_NAME_CACHE_SIZE = 1024
+_user_name_cache = OrderedDict()
+
+# Recent administrator check results keyed by (guild ID, user ID)
+# Entries expire after a short TTL and are dropped early when the member's roles change,
+# the member leaves, or the guild's roles or owner change
+ADMIN_CACHE_TTL = 30.0
+ADMIN_CACHE_SIZE = 1024
+_admin_cache = {}
+
+# Seconds to wait before retrying a failed ban log write
+BAN_LOG_RETRY_DELAY = 5.0
+
+# Longest time shutdown waits for queued ban records to be written
+SHUTDOWN_FLUSH_TIMEOUT = 30.0
+
+# Seconds to wait after a network change before writing it to disk
+# Changes made within this window are coalesced into a single write
+NETWORKS_FLUSH_DELAY = 1.0
 
 # Define the standard green color for all embeds
 # Using a consistent color scheme improves user experience and brand recognition
 EMBED_COLOR = discord.Color.green()
 
+# Maximum number of fields Discord allows in a single embed
+MAX_EMBED_FIELDS = 25
+
 # Helper function to create embeds with consistent styling
 # This centralizes embed creation to ensure all bot responses have a uniform appearance
 def create_embed(title, description=None):
@@ -58,6 +129,11 @@ def create_embed(title, description=None):
     )
     return embed
 
+# Shared replies with fixed content
+# Built once at import since embeds can be sent any number of times
+PERM_DENIED_EMBED = create_embed("Permission Denied", "You need administrator permissions to use this command.")
+NO_NETWORKS_EMBED = create_embed("No Networks", "This server is not part of any ban sync networks.")
+
 # Initialize data files if they don't exist
 # This ensures the bot can start without errors even on first run
 def initialize_data_files():
@@ -68,48 +144,265 @@ def initialize_data_files():
     and ensures data structures are properly initialized.
     """
     if not os.path.exists(SYNC_NETWORKS_FILE):
-        with open(SYNC_NETWORKS_FILE, "w") as f:
-            json.dump({}, f)  # Initialize with empty dictionary for networks
+        with open(SYNC_NETWORKS_FILE, "wb") as f:
+            f.write(orjson.dumps({}))  # Initialize with empty dictionary for networks
     
     if not os.path.exists(BAN_LOG_FILE):
-        with open(BAN_LOG_FILE, "w") as f:
-            json.dump([], f)  # Initialize with empty list for ban logs
+        # Carry over records from the old single-array ban log if present
+        legacy_log = []
+        if os.path.exists(LEGACY_BAN_LOG_FILE):
+            with open(LEGACY_BAN_LOG_FILE, "rb") as f:
+                legacy_log = orjson.loads(f.read())
+        
+        # Written atomically: a partial file would stop the migration from ever re-running
+        data = b"".join(orjson.dumps(ban_data) + b"\n" for ban_data in legacy_log)
+        write_file_atomic(BAN_LOG_FILE, data)
+        
+        if legacy_log:
+            logger.info(f"Migrated {len(legacy_log)} records from {LEGACY_BAN_LOG_FILE} to {BAN_LOG_FILE}")
+    
+    # An append cut short by a crash leaves a line without its newline; end it so
+    # the next record starts on a fresh line instead of being glued onto it
+    with open(BAN_LOG_FILE, "rb+") as f:
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+                logger.warning(f"{BAN_LOG_FILE} ended with an incomplete line")
+
+# Blocking file helpers
+# These run in the default executor so disk I/O never stalls the event loop
+def read_file(path):
+    """
+    Read the full contents of a file as bytes
+    
+    Parameters:
+        path: Path of the file to read
+        
+    Returns:
+        bytes: The file contents
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
+def write_file_atomic(path, data):
+    """
+    Replace a file's contents without ever exposing a partially written file
+    
+    The data is written to a temporary file which then replaces the real one,
+    so a crash mid-write can never leave a truncated file behind. The temporary
+    file is synced to disk before the rename so the new contents are durable.
+    
+    Parameters:
+        path: Path of the file to replace
+        data: Bytes to write
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def append_to_file(path, data):
+    """
+    Append bytes to the end of a file
+    
+    Parameters:
+        path: Path of the file to append to
+        data: Bytes to append
+    """
+    with open(path, "ab") as f:
+        f.write(data)
 
 # Load sync networks from file
 # This retrieves the current state of all ban sync networks
-def load_sync_networks():
+async def load_sync_networks():
     """
     Load the sync networks data from JSON file
     
+    Server lists are converted to sets so membership checks are O(1).
+    
     Returns:
         dict: A dictionary of all sync networks with their configurations
     """
-    with open(SYNC_NETWORKS_FILE, "r") as f:
-        return json.load(f)
+    raw = await bot.loop.run_in_executor(None, read_file, SYNC_NETWORKS_FILE)
+    networks = orjson.loads(raw)
+    for data in networks.values():
+        data["servers"] = set(data["servers"])
+    return networks
 
 # Save sync networks to file
 # This persists any changes to the network configurations
-def save_sync_networks(networks):
+async def save_sync_networks(networks):
     """
     Save the sync networks data to JSON file
     
+    The data is serialized on the event loop, so it is a consistent snapshot,
+    and then written atomically from the executor.
+    
     Parameters:
         networks: Dictionary of network data to save
     """
-    with open(SYNC_NETWORKS_FILE, "w") as f:
-        json.dump(networks, f, indent=4)  # Use indentation for human readability
+    # Server sets are written back out as sorted JSON lists so the file is stable across saves
+    # Written compactly; the file is machine-read, use `jq .` to inspect it
+    data = orjson.dumps(networks, default=sorted)
+    await bot.loop.run_in_executor(None, write_file_atomic, SYNC_NETWORKS_FILE, data)
+
+# Background writer for the sync networks
+# Commands only mark the networks as changed; this task persists them
+async def flush_sync_networks():
+    """
+    Persist the sync networks whenever they have been marked as changed
+    
+    Waits briefly after the first change so a burst of joins and leaves
+    results in one write instead of one per command.
+    """
+    while True:
+        await bot._networks_dirty.wait()
+        await asyncio.sleep(NETWORKS_FLUSH_DELAY)
+        async with bot._networks_lock:
+            # Clear before writing: changes made after this point mark the networks dirty again
+            bot._networks_dirty.clear()
+            try:
+                await save_sync_networks(bot.networks)
+            except Exception:
+                # Any error, not just OSError, must keep this task alive
+                logger.exception("Failed to save sync networks")
+                bot._networks_dirty.set()  # Retry on the next pass
+
+# Build the guild -> networks reverse index
+# This lets commands find a server's networks without scanning all of them
+def build_guild_index(networks):
+    """
+    Build a mapping from each guild ID to the networks it belongs to
+    
+    Parameters:
+        networks: Dictionary of network data
+        
+    Returns:
+        dict: Guild IDs mapped to sets of network names
+    """
+    guild_to_networks = {}
+    for name, data in networks.items():
+        for server_id in data["servers"]:
+            guild_to_networks.setdefault(server_id, set()).add(name)
+    return guild_to_networks
 
-# Load ban log from file
-# This retrieves the history of all synchronized bans
-def load_ban_log():
+# Find the networks a server belongs to
+# Shared by every command that needs the current server's networks
+def networks_for_guild(guild_id):
     """
-    Load the ban history from JSON file
+    Get the names of all networks a server is part of
     
+    Parameters:
+        guild_id: The ID of the server
+        
     Returns:
-        list: A list of all recorded ban events
+        list: Sorted network names, empty if the server is in no networks
+    """
+    return sorted(bot.guild_to_networks.get(guild_id, ()))
+
+# Add a server to a network
+# This updates the network's server set and the reverse index together
+def add_server_to_network(network_name, guild_id):
+    """
+    Add a server to a network and record it in the guild index
+    
+    Must be called while holding the networks lock.
+    
+    Parameters:
+        network_name: The name of the network to add the server to
+        guild_id: The ID of the server to add
+    """
+    bot.networks[network_name]["servers"].add(guild_id)
+    bot.guild_to_networks.setdefault(guild_id, set()).add(network_name)
+
+# Remove a server from a network
+# This updates the network's server set and the reverse index together
+def remove_server_from_network(network_name, guild_id):
+    """
+    Remove a server from a network and from the guild index
+    
+    Must be called while holding the networks lock.
+    
+    Parameters:
+        network_name: The name of the network to remove the server from
+        guild_id: The ID of the server to remove
     """
-    with open(BAN_LOG_FILE, "r") as f:
-        return json.load(f)
+    bot.networks[network_name]["servers"].remove(guild_id)
+    guild_networks = bot.guild_to_networks[guild_id]
+    guild_networks.discard(network_name)
+    if not guild_networks:
+        del bot.guild_to_networks[guild_id]  # Keep the index free of empty entries
+
+# Load the most recent bans from the log
+# This reads only the end of the file so history lookups stay fast as the log grows
+def load_recent_bans(limit):
+    """
+    Load the most recent ban records without reading the whole log
+    
+    Works like `tail -n`: the file is read backwards in fixed-size blocks
+    and lines are parsed newest first until `limit` records are collected.
+    Blank lines are ignored and lines that are not valid JSON are skipped
+    with a warning, so neither takes a slot in `limit`.
+    
+    Parameters:
+        limit: Maximum number of records to return
+        
+    Returns:
+        list: Up to `limit` ban records, newest first
+    """
+    if limit <= 0:
+        return []
+    
+    block_size = 8192
+    recent_bans = []
+    # Bytes before the first newline of the last block read; their line may start earlier
+    partial = b""
+    with open(BAN_LOG_FILE, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        while position > 0 and len(recent_bans) < limit:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + partial).split(b"\n")
+            # Until the start of the file is reached the first piece may be incomplete,
+            # so hold it back and finish it with the next block
+            partial = lines.pop(0) if position > 0 else b""
+            
+            for line in reversed(lines):
+                if not line.strip():
+                    continue
+                # A crash or full disk mid-append can leave a torn line; skip it rather than
+                # making the whole history unreadable
+                try:
+                    recent_bans.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable line in {BAN_LOG_FILE}: {line[:80]!r}")
+                    continue
+                if len(recent_bans) == limit:
+                    break
+    return recent_bans
+
+# Get the most recent bans
+# This serves history lookups from the in-memory tail of the ban log
+def get_recent_bans(limit):
+    """
+    Get the most recent ban records
+    
+    The tail holds BAN_LOG_TAIL_SIZE records, including ones still queued
+    for the writer. ban_history caps its limit at MAX_EMBED_FIELDS, well
+    below that, so the log file never needs to be read here.
+    
+    Parameters:
+        limit: Maximum number of records to return
+        
+    Returns:
+        list: Up to `limit` ban records, newest first
+    """
+    return list(islice(reversed(bot.recent_bans), max(limit, 0)))
 
 # Save ban to log
 # This records each ban action for audit and history purposes
@@ -117,13 +410,117 @@ def save_ban_to_log(ban_data):
     """
     Add a new ban record to the ban history log
     
+    The record is visible to ban_history immediately and queued for the
+    background writer, so callers never wait on the disk.
+    
     Parameters:
         ban_data: Dictionary containing details about the ban event
     """
-    ban_log = load_ban_log()
-    ban_log.append(ban_data)
-    with open(BAN_LOG_FILE, "w") as f:
-        json.dump(ban_log, f, indent=4)  # Use indentation for human readability
+    bot.recent_bans.append(ban_data)
+    bot._ban_log_queue.put_nowait(ban_data)
+
+# Background writer for the ban log
+# Appends queued ban records to the log file in the order they were logged
+async def write_ban_log():
+    """
+    Append queued ban records to the ban history log
+    
+    Each record is written as a single compact line, so logging a ban never
+    has to read or rewrite the existing history. Records that queue up while
+    a write is in progress are appended together in one write.
+    """
+    while True:
+        batch = [await bot._ban_log_queue.get()]
+        while not bot._ban_log_queue.empty():
+            batch.append(bot._ban_log_queue.get_nowait())
+        
+        # Encode records one by one so a record that can't be serialized is the only one lost
+        lines = []
+        for ban_data in batch:
+            try:
+                lines.append(orjson.dumps(ban_data) + b"\n")
+            except orjson.JSONEncodeError:
+                logger.exception(f"Dropping ban record that can't be serialized: {ban_data!r}")
+        data = b"".join(lines)
+        
+        # These are audit records, so a failed write is retried rather than dropped
+        while data:
+            try:
+                await bot.loop.run_in_executor(None, append_to_file, BAN_LOG_FILE, data)
+                break
+            except Exception:
+                logger.exception(f"Failed to write {len(lines)} ban records to {BAN_LOG_FILE}, "
+                                 f"retrying in {BAN_LOG_RETRY_DELAY} seconds")
+                # A failed append may have left a partial line; start the retry on a new line
+                if not data.startswith(b"\n"):
+                    data = b"\n" + data
+                await asyncio.sleep(BAN_LOG_RETRY_DELAY)
+        
+        for _ in batch:
+            bot._ban_log_queue.task_done()
+
+# Flush pending writes
+# This is run on shutdown so queued data isn't lost
+async def flush_pending_writes():
+    """
+    Write out pending network changes and wait for queued ban records
+    
+    Without this, changes made inside the last flush window before shutdown
+    would be lost.
+    """
+    # Nothing can have been queued if the state never finished loading
+    if bot.networks is None:
+        return
+    
+    async with bot._networks_lock:
+        if bot._networks_dirty.is_set():
+            bot._networks_dirty.clear()
+            await save_sync_networks(bot.networks)
+    
+    # Bounded, since the writer keeps retrying if the disk stays broken
+    try:
+        await asyncio.wait_for(bot._ban_log_queue.join(), SHUTDOWN_FLUSH_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.error(f"Shutting down before every ban record was written to {BAN_LOG_FILE}")
+
+# Resolve a user's display name
+# This is used for ban messages and logging, backed by a small LRU cache
+async def resolve_user_name(user_id):
+    """
+    Get a display name for a user ID, fetching it from Discord only when needed
+    
+    This is a best-effort lookup - users that cannot be fetched get a
+    placeholder name containing their ID.
+    
+    Parameters:
+        user_id: The Discord ID of the user
+        
+    Returns:
+        str: The user's display name
+    """
+    if user_id in _user_name_cache:
+        _user_name_cache.move_to_end(user_id)
+        return _user_name_cache[user_id]
+    
+    # Users sharing a guild with the bot are already in its cache; only fetch on a miss
+    user = bot.get_user(user_id)
+    if user is None:
+        try:
+            user = await bot.fetch_user(user_id)
+        except discord.HTTPException:  # Includes NotFound for deleted or unknown users
+            # Not cached, so a transient failure doesn't stick
+            return f"Unknown User ({user_id})"
+    
+    # Handle Discord's new username system
+    if hasattr(user, 'discriminator') and user.discriminator != '0':
+        user_name = f"{user.name}#{user.discriminator}"
+    else:
+        user_name = user.name
+    
+    _user_name_cache[user_id] = user_name
+    if len(_user_name_cache) > USER_NAME_CACHE_SIZE:
+        _user_name_cache.popitem(last=False)  # Evict the least recently used name
+    return user_name
 
 # Check if user has admin permissions
 # This is used to restrict sensitive commands to server administrators
@@ -131,13 +528,76 @@ def is_admin(ctx):
     """
     Check if a user has administrator permissions in their server
     
+    Behaves like commands.has_permissions(administrator=True), but results
+    are cached for ADMIN_CACHE_TTL seconds so repeated commands don't
+    recompute permissions from the member's roles each time.
+    
     Parameters:
         ctx: The command context containing the author
         
     Returns:
-        bool: True if the user has administrator permissions, False otherwise
+        bool: True if the user has administrator permissions
+        
+    Raises:
+        commands.NoPrivateMessage: If the command was used outside a server
+        commands.MissingPermissions: If the user is not an administrator
     """
-    return ctx.author.guild_permissions.administrator
+    if ctx.guild is None:
+        raise commands.NoPrivateMessage()
+    
+    key = (ctx.guild.id, ctx.author.id)
+    now = time.monotonic()
+    cached = _admin_cache.get(key)
+    if cached is not None and cached[1] > now:
+        result = cached[0]
+    else:
+        # Drop expired entries before the cache grows past its bound
+        if len(_admin_cache) >= ADMIN_CACHE_SIZE:
+            for expired_key in [k for k, (_, expires_at) in _admin_cache.items() if expires_at <= now]:
+                del _admin_cache[expired_key]
+            if len(_admin_cache) >= ADMIN_CACHE_SIZE:
+                _admin_cache.clear()
+        
+        result = ctx.author.guild_permissions.administrator
+        _admin_cache[key] = (result, now + ADMIN_CACHE_TTL)
+    
+    if not result:
+        raise commands.MissingPermissions(["administrator"])
+    return True
+
+# Load persisted state
+# This runs once at startup, from BanSyncBot.setup_hook
+async def load_bot_state():
+    """
+    Load the sync networks and recent bans and start the background writers
+    
+    This method:
+    1. Starts the background networks and ban log writers
+    2. Initializes data files
+    3. Loads the sync networks and the most recent bans into memory
+    """
+    # Created here rather than at import so they bind to the running loop;
+    # on Python 3.8/3.9 asyncio primitives bind to the loop current at creation
+    bot._networks_lock = asyncio.Lock()  # Guards mutations of bot.networks across commands
+    bot._ban_semaphore = asyncio.Semaphore(MAX_CONCURRENT_BANS)  # Bounds in-flight remote bans
+    
+    # Start the background writers before anything that can fail, so a failed
+    # load never leaves the bot without them
+    bot._networks_dirty = asyncio.Event()
+    bot._ban_log_queue = asyncio.Queue()
+    bot._networks_flusher = bot.loop.create_task(flush_sync_networks())
+    bot._ban_log_writer = bot.loop.create_task(write_ban_log())
+    
+    await bot.loop.run_in_executor(None, initialize_data_files)
+    networks = await load_sync_networks()
+    guild_to_networks = build_guild_index(networks)
+    recent_bans = await bot.loop.run_in_executor(None, load_recent_bans, BAN_LOG_TAIL_SIZE)
+    
+    # Publish the loaded state only once all of it has loaded; bot.networks goes
+    # last because it marks the state as loaded
+    bot.recent_bans = deque(reversed(recent_bans), maxlen=BAN_LOG_TAIL_SIZE)
+    bot.guild_to_networks = guild_to_networks
+    bot.networks = networks
 
 # Bot initialization event
 @bot.event
@@ -146,17 +606,33 @@ async def on_ready():
     Event handler triggered when bot successfully connects to Discord
     
     This method:
-    1. Initializes data files
-    2. Logs the successful connection
-    3. Sets the bot's status message
+    1. Logs the successful connection
+    2. Sets the bot's status message
     """
-    initialize_data_files()
     logger.info(f"Bot is ready! Logged in as {bot.user}")
     await bot.change_presence(activity=discord.Game(name="Syncing bans"))
 
+# Command error handler
+# Reports missing administrator permissions; everything else is logged
+@bot.event
+async def on_command_error(ctx, error):
+    """
+    Event handler triggered when a command raises an error or fails a check
+    
+    Parameters:
+        ctx: The command context
+        error: The exception raised while invoking the command
+    """
+    if isinstance(error, commands.MissingPermissions):
+        await ctx.send(embed=PERM_DENIED_EMBED)
+        return
+    
+    logger.error(f"Error in command '{ctx.command}': {error}", exc_info=error)
+
 # Create a new sync network
 # This establishes a new network that servers can join for ban synchronization
 @bot.command(name="create_network")
+@commands.check(is_admin)  # Only administrators can use this command
 async def create_network(ctx, network_name: str):
     """
     Create a new ban sync network
@@ -165,42 +641,38 @@ async def create_network(ctx, network_name: str):
     1. Verifies the user has administrator permissions
     2. Checks if the network name is already in use
     3. Creates a new network with the current server as owner
-    4. Saves the network configuration
+    4. Schedules the network configuration to be saved
     
     Parameters:
         ctx: The command context
         network_name: The name for the new network
     """
-    # Permission check - only administrators can create networks
-    if not is_admin(ctx):
-        embed = create_embed("Permission Denied", "You need administrator permissions to use this command.")
-        await ctx.send(embed=embed)
-        return
-    
-    networks = load_sync_networks()
-    
-    # Prevent duplicate network names
-    if network_name in networks:
-        embed = create_embed("Network Already Exists", f"Network '{network_name}' already exists.")
-        await ctx.send(embed=embed)
-        return
-    
-    # Create the network with the current server as both owner and first member
-    networks[network_name] = {
-        "owner": ctx.guild.id,  # The server that created the network
-        "servers": [ctx.guild.id],  # List of servers in the network
-        "created_at": datetime.now().isoformat()  # Creation timestamp for auditing
-    }
-    
-    save_sync_networks(networks)
-    logger.info(f"Network '{network_name}' created by {ctx.author} in {ctx.guild.name}")
+    async with bot._networks_lock:
+        networks = bot.networks
+        
+        # Prevent duplicate network names
+        if network_name in networks:
+            embed = create_embed("Network Already Exists", f"Network '{network_name}' already exists.")
+        else:
+            # Create the network with the current server as both owner and first member
+            networks[network_name] = {
+                "owner": ctx.guild.id,  # The server that created the network
+                "servers": set(),  # Set of servers in the network
+                "created_at": datetime.now().isoformat()  # Creation timestamp for auditing
+            }
+            add_server_to_network(network_name, ctx.guild.id)
+            
+            bot._networks_dirty.set()  # Persisted by the background writer
+            logger.info(f"Network '{network_name}' created by {ctx.author} in {ctx.guild.name}")
+            embed = create_embed("Network Created", f"✅ Ban sync network '{network_name}' created successfully!")
     
-    embed = create_embed("Network Created", f"✅ Ban sync network '{network_name}' created successfully!")
+    # Reply after releasing the lock so a slow send doesn't hold up other commands
     await ctx.send(embed=embed)
 
 # Join an existing sync network
 # This adds the current server to an existing ban sync network
 @bot.command(name="join_network")
+@commands.check(is_admin)  # Only administrators can use this command
 async def join_network(ctx, network_name: str):
     """
     Join an existing ban sync network
@@ -215,37 +687,31 @@ async def join_network(ctx, network_name: str):
         ctx: The command context
         network_name: The name of the network to join
     """
-    # Permission check - only administrators can join networks
-    if not is_admin(ctx):
-        embed = create_embed("Permission Denied", "You need administrator permissions to use this command.")
-        await ctx.send(embed=embed)
-        return
-    
-    networks = load_sync_networks()
-    
-    # Verify the network exists
-    if network_name not in networks:
-        embed = create_embed("Network Not Found", f"Network '{network_name}' does not exist.")
-        await ctx.send(embed=embed)
-        return
-    
-    # Prevent joining a network multiple times
-    if ctx.guild.id in networks[network_name]["servers"]:
-        embed = create_embed("Already Joined", f"This server is already part of the '{network_name}' network.")
-        await ctx.send(embed=embed)
-        return
-    
-    # Add the server to the network
-    networks[network_name]["servers"].append(ctx.guild.id)
-    save_sync_networks(networks)
+    async with bot._networks_lock:
+        networks = bot.networks
+        
+        # Verify the network exists
+        if network_name not in networks:
+            embed = create_embed("Network Not Found", f"Network '{network_name}' does not exist.")
+        
+        # Prevent joining a network multiple times
+        elif ctx.guild.id in networks[network_name]["servers"]:
+            embed = create_embed("Already Joined", f"This server is already part of the '{network_name}' network.")
+        
+        else:
+            # Add the server to the network
+            add_server_to_network(network_name, ctx.guild.id)
+            bot._networks_dirty.set()  # Persisted by the background writer
+            logger.info(f"{ctx.guild.name} joined network '{network_name}'")
+            embed = create_embed("Network Joined", f"✅ Joined ban sync network '{network_name}' successfully!")
     
-    logger.info(f"{ctx.guild.name} joined network '{network_name}'")
-    embed = create_embed("Network Joined", f"✅ Joined ban sync network '{network_name}' successfully!")
+    # Reply after releasing the lock so a slow send doesn't hold up other commands
     await ctx.send(embed=embed)
 
 # Leave a sync network
 # This removes the current server from a ban sync network
 @bot.command(name="leave_network")
+@commands.check(is_admin)  # Only administrators can use this command
 async def leave_network(ctx, network_name: str):
     """
     Leave a ban sync network
@@ -261,43 +727,38 @@ async def leave_network(ctx, network_name: str):
         ctx: The command context
         network_name: The name of the network to leave
     """
-    # Permission check - only administrators can leave networks
-    if not is_admin(ctx):
-        embed = create_embed("Permission Denied", "You need administrator permissions to use this command.")
-        await ctx.send(embed=embed)
-        return
-    
-    networks = load_sync_networks()
-    
-    # Verify the network exists
-    if network_name not in networks:
-        embed = create_embed("Network Not Found", f"Network '{network_name}' does not exist.")
-        await ctx.send(embed=embed)
-        return
-    
-    # Verify the server is in the network
-    if ctx.guild.id not in networks[network_name]["servers"]:
-        embed = create_embed("Not In Network", f"This server is not part of the '{network_name}' network.")
-        await ctx.send(embed=embed)
-        return
-    
-    # Remove the server from the network
-    networks[network_name]["servers"].remove(ctx.guild.id)
-    
-    # Clean up empty networks to prevent clutter
-    if len(networks[network_name]["servers"]) == 0:
-        del networks[network_name]
-        embed = create_embed("Network Deleted", f"Network '{network_name}' has been deleted as it has no more servers.")
-    else:
-        embed = create_embed("Left Network", f"Left ban sync network '{network_name}' successfully.")
+    async with bot._networks_lock:
+        networks = bot.networks
+        
+        # Verify the network exists
+        if network_name not in networks:
+            embed = create_embed("Network Not Found", f"Network '{network_name}' does not exist.")
+        
+        # Verify the server is in the network
+        elif ctx.guild.id not in networks[network_name]["servers"]:
+            embed = create_embed("Not In Network", f"This server is not part of the '{network_name}' network.")
+        
+        else:
+            # Remove the server from the network
+            remove_server_from_network(network_name, ctx.guild.id)
+            
+            # Clean up empty networks to prevent clutter
+            if len(networks[network_name]["servers"]) == 0:
+                del networks[network_name]
+                embed = create_embed("Network Deleted", f"Network '{network_name}' has been deleted as it has no more servers.")
+            else:
+                embed = create_embed("Left Network", f"Left ban sync network '{network_name}' successfully.")
+            
+            bot._networks_dirty.set()  # Persisted by the background writer
+            logger.info(f"{ctx.guild.name} left network '{network_name}'")
     
-    save_sync_networks(networks)
-    logger.info(f"{ctx.guild.name} left network '{network_name}'")
+    # Reply after releasing the lock so a slow send doesn't hold up other commands
     await ctx.send(embed=embed)
 
 # List all networks the server is part of
 # This shows which ban sync networks the current server has joined
 @bot.command(name="list_networks")
+@commands.check(is_admin)  # Only administrators can use this command
 async def list_networks(ctx):
     """
     List all networks the server is part of
@@ -310,24 +771,12 @@ async def list_networks(ctx):
     Parameters:
         ctx: The command context
     """
-    # Permission check - only administrators can view network memberships
-    if not is_admin(ctx):
-        embed = create_embed("Permission Denied", "You need administrator permissions to use this command.")
-        await ctx.send(embed=embed)
-        return
-    
-    networks = load_sync_networks()
-    server_networks = []
-    
     # Find all networks this server is part of
-    for name, data in networks.items():
-        if ctx.guild.id in data["servers"]:
-            server_networks.append(name)
+    server_networks = networks_for_guild(ctx.guild.id)
     
     # Handle case where server is not in any networks
     if not server_networks:
-        embed = create_embed("No Networks", "This server is not part of any ban sync networks.")
-        await ctx.send(embed=embed)
+        await ctx.send(embed=NO_NETWORKS_EMBED)
         return
     
     # Format the list of networks for display
@@ -338,6 +787,7 @@ async def list_networks(ctx):
 # Ban a user and sync the ban across the network
 # This is the core functionality - banning a user in all connected servers
 @bot.command(name="syncban")
+@commands.check(is_admin)  # Only administrators can use this command
 async def syncban(ctx, user_id: int, *, reason="No reason provided"):
     """
     Ban a user and sync the ban across all networks
@@ -346,7 +796,7 @@ async def syncban(ctx, user_id: int, *, reason="No reason provided"):
     1. Verifies the user has administrator permissions
     2. Finds all networks the server is part of
     3. Bans the user in the current server
-    4. Propagates the ban to all other servers in the networks
+    4. Propagates the ban concurrently to all other servers in the networks
     5. Logs the ban action for audit purposes
     
     Parameters:
@@ -354,52 +804,46 @@ async def syncban(ctx, user_id: int, *, reason="No reason provided"):
         user_id: The Discord ID of the user to ban
         reason: Optional justification for the ban
     """
-    # Permission check - only administrators can issue bans
-    if not is_admin(ctx):
-        embed = create_embed("Permission Denied", "You need administrator permissions to use this command.")
-        await ctx.send(embed=embed)
+    # Handle case where server is not in any networks before doing any other work
+    server_networks = networks_for_guild(ctx.guild.id)
+    if not server_networks:
+        await ctx.send(embed=NO_NETWORKS_EMBED)
         return
     
-    networks = load_sync_networks()
-    server_networks = []
-    
-    # Find all networks this server is part of
-    for name, data in networks.items():
-        if ctx.guild.id in data["servers"]:
-            server_networks.append(name)
+    # Collect the servers to sync to now, before any await lets the networks change
+    # A server can belong to several of these networks, so collect each target once
+    networks = bot.networks
+    target_ids = set().union(*(networks[n]["servers"] for n in server_networks)) - {ctx.guild.id}
+    # Resolve each target once, skipping servers the bot is no longer in
+    targets = [guild for server_id in target_ids if (guild := bot.get_guild(server_id))]
     
-    # Handle case where server is not in any networks
-    if not server_networks:
-        embed = create_embed("No Networks", "This server is not part of any ban sync networks.")
-        await ctx.send(embed=embed)
-        return
+    # The ban target and audit log reasons are identical for every server, so build them once
+    ban_target = discord.Object(id=user_id)
+    local_reason = f"[Ban Sync] {reason}"
+    remote_reason = f"[Ban Sync from {ctx.guild.name}] {reason}"
     
-    # Try to get user information for better logging
+    # Look up the user while the local ban is in flight so the two round-trips overlap
     # This is a best-effort approach - we can still ban by ID if user info is unavailable
-    try:
-        user = await bot.fetch_user(user_id)
-        # Handle Discord's new username system
-        if hasattr(user, 'discriminator') and user.discriminator != '0':
-            user_name = f"{user.name}#{user.discriminator}"
-        else:
-            user_name = user.name
-    except:
-        user_name = f"Unknown User ({user_id})"
+    user_task = asyncio.create_task(resolve_user_name(user_id))
     
     # Ban the user in the current server first
     try:
-        await ctx.guild.ban(discord.Object(id=user_id), reason=f"[Ban Sync] {reason}")
-        embed = create_embed("User Banned", f"✅ Banned {user_name} from this server.")
-        await ctx.send(embed=embed)
+        await ctx.guild.ban(ban_target, reason=local_reason)
     except discord.Forbidden:
+        user_task.cancel()
         embed = create_embed("Permission Error", "I don't have permission to ban users in this server.")
         await ctx.send(embed=embed)
         return
     except discord.HTTPException as e:
+        user_task.cancel()
         embed = create_embed("Ban Failed", f"Failed to ban user: {e}")
         await ctx.send(embed=embed)
         return
     
+    user_name = await user_task
+    embed = create_embed("User Banned", f"✅ Banned {user_name} from this server.")
+    await ctx.send(embed=embed)
+    
     # Create comprehensive ban data for logging and auditing
     ban_data = {
         "user_id": user_id,
@@ -418,18 +862,20 @@ async def syncban(ctx, user_id: int, *, reason="No reason provided"):
     
     # Sync the ban to all servers in all networks this server is part of
     # This is the core synchronization functionality
-    ban_count = 1  # Start count at 1 for the current server
-    for network_name in server_networks:
-        for server_id in networks[network_name]["servers"]:
-            if server_id != ctx.guild.id:  # Skip the current server (already banned)
-                server = bot.get_guild(server_id)
-                if server:
-                    try:
-                        await server.ban(discord.Object(id=user_id), reason=f"[Ban Sync from {ctx.guild.name}] {reason}")
-                        ban_count += 1
-                        logger.info(f"Synced ban of {user_id} to {server.name}")
-                    except Exception as e:
-                        logger.error(f"Failed to sync ban to {server.name}: {e}")
+    async def _ban_one(server):
+        try:
+            async with bot._ban_semaphore:
+                await server.ban(ban_target, reason=remote_reason)
+            logger.info(f"Synced ban of {user_id} to {server.name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to sync ban to {server.name}: {e}")
+            return False
+    
+    # Issue all remote bans concurrently rather than one round-trip at a time
+    # return_exceptions keeps one unexpected failure from abandoning the other bans
+    results = await asyncio.gather(*(_ban_one(server) for server in targets), return_exceptions=True)
+    ban_count = 1 + sum(result is True for result in results)  # Count the current server plus every successful sync
     
     # Report the results of the ban synchronization
     embed = create_embed("Ban Synced", f"✅ Ban synced across {ban_count} servers in {len(server_networks)} networks.")
@@ -439,53 +885,87 @@ async def syncban(ctx, user_id: int, *, reason="No reason provided"):
 # Show recent ban sync activity
 # This provides an audit trail of recent ban actions
 @bot.command(name="ban_history")
+@commands.check(is_admin)  # Only administrators can use this command
 async def ban_history(ctx, limit: int = 5):
     """
     Show recent ban sync activity
     
     This command:
     1. Verifies the user has administrator permissions
-    2. Retrieves the ban log
+    2. Retrieves the most recent entries from the in-memory ban log tail
     3. Displays the most recent ban actions
     
     Parameters:
         ctx: The command context
         limit: Optional number of recent bans to show (default: 5)
     """
-    # Permission check - only administrators can view ban history
-    if not is_admin(ctx):
-        embed = create_embed("Permission Denied", "You need administrator permissions to use this command.")
-        await ctx.send(embed=embed)
-        return
-    
-    ban_log = load_ban_log()
+    # Discord rejects embeds with more fields than this, so larger limits can't be shown
+    recent_bans = get_recent_bans(min(limit, MAX_EMBED_FIELDS))
     
     # Handle case where no bans have been recorded
-    if not ban_log:
+    if not recent_bans:
         embed = create_embed("No History", "No ban sync history found.")
         await ctx.send(embed=embed)
         return
     
-    # Sort by timestamp (newest first) and limit to requested number
-    recent_bans = sorted(ban_log, key=lambda x: x["timestamp"], reverse=True)[:limit]
-    
     embed = create_embed("Recent Ban Sync Activity")
     
     # Add each ban as a field in the embed
     for ban in recent_bans:
-        # Format the timestamp for readability
-        timestamp = datetime.fromisoformat(ban["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+        # Timestamps are stored by datetime.isoformat(), so "YYYY-MM-DD HH:MM:SS"
+        # is just its first 19 characters with the date/time separator swapped
+        timestamp = ban["timestamp"][:19].replace("T", " ")
+        networks_list = ", ".join(ban["networks"])
         embed.add_field(
             name=f"{ban['user_name']} (ID: {ban['user_id']})",
             value=f"**Reason:** {ban['reason']}\n"
                   f"**Initiated by:** {ban['initiator_user_name']} in {ban['initiator_server_name']}\n"
                   f"**Time:** {timestamp}\n"
-                  f"**Networks:** {', '.join(ban['networks'])}",
+                  f"**Networks:** {networks_list}",
             inline=False
         )
     
     await ctx.send(embed=embed)
 
+# Help embed
+# The command list is static, so the embed is built once at import
+SYNCHELP_EMBED = create_embed(
+    "Ban Sync Bot Help",
+    "Commands for managing ban synchronization across servers"
+)
+
+# Add each command with its description
+SYNCHELP_EMBED.add_field(
+    name="!create_network <network_name>",
+    value="Create a new ban sync network",
+    inline=False
+)
+SYNCHELP_EMBED.add_field(
+    name="!join_network <network_name>",
+    value="Join an existing ban sync network",
+    inline=False
+)
+SYNCHELP_EMBED.add_field(
+    name="!leave_network <network_name>",
+    value="Leave a ban sync network",
+    inline=False
+)
+SYNCHELP_EMBED.add_field(
+    name="!list_networks",
+    value="List all networks this server is part of",
+    inline=False
+)
+SYNCHELP_EMBED.add_field(
+    name="!syncban <user_id> [reason]",
+    value="Ban a user and sync the ban across all networks",
+    inline=False
+)
+SYNCHELP_EMBED.add_field(
+    name="!ban_history [limit]",
+    value="Show recent ban sync activity (default: 5 most recent)",
+    inline=False
+)
+
 # Help command
 # This provides documentation on available commands
 @bot.command(name="synchelp")
@@ -493,50 +973,94 @@ async def synchelp(ctx):
     """
     Display help information for the Ban Sync Bot
     
-    This command creates a comprehensive help embed with all available commands
+    This command sends a comprehensive help embed with all available commands
     and their descriptions to assist users in using the bot correctly.
     
     Parameters:
         ctx: The command context
     """
-    embed = create_embed(
-        "Ban Sync Bot Help",
-        "Commands for managing ban synchronization across servers"
-    )
+    await ctx.send(embed=SYNCHELP_EMBED)
+
+# Drop every cached administrator check for a guild
+def clear_guild_admin_cache(guild_id):
+    """
+    Remove all cached administrator checks for a guild
     
-    # Add each command with its description
-    embed.add_field(
-        name="!create_network <network_name>",
-        value="Create a new ban sync network",
-        inline=False
-    )
-    embed.add_field(
-        name="!join_network <network_name>",
-        value="Join an existing ban sync network",
-        inline=False
-    )
-    embed.add_field(
-        name="!leave_network <network_name>",
-        value="Leave a ban sync network",
-        inline=False
-    )
-    embed.add_field(
-        name="!list_networks",
-        value="List all networks this server is part of",
-        inline=False
-    )
-    embed.add_field(
-        name="!syncban <user_id> [reason]",
-        value="Ban a user and sync the ban across all networks",
-        inline=False
-    )
-    embed.add_field(
-        name="!ban_history [limit]",
-        value="Show recent ban sync activity (default: 5 most recent)",
-        inline=False
-    )
+    Parameters:
+        guild_id: The ID of the guild whose entries should be dropped
+    """
+    for key in [k for k in _admin_cache if k[0] == guild_id]:
+        del _admin_cache[key]
+
+# Event listeners for permission changes
+# These keep cached administrator checks from outliving a role, membership or owner change
+@bot.event
+async def on_member_update(before, after):
+    """
+    Event handler triggered when a member's roles or profile change
     
-    await ctx.send(embed=embed)
+    Parameters:
+        before: The member before the update
+        after: The member after the update
+    """
+    if before.roles != after.roles:
+        _admin_cache.pop((after.guild.id, after.id), None)
+
+@bot.event
+async def on_member_remove(member):
+    """
+    Event handler triggered when a member leaves, is kicked or is banned
+    
+    A member who rejoins comes back without their roles, so their cached
+    check must not carry over.
+    
+    Parameters:
+        member: The member who left the guild
+    """
+    _admin_cache.pop((member.guild.id, member.id), None)
+
+@bot.event
+async def on_guild_role_update(before, after):
+    """
+    Event handler triggered when a role is edited
+    
+    A role's permissions can change for every member holding it, so all
+    cached checks for the guild are dropped.
+    
+    Parameters:
+        before: The role before the update
+        after: The role after the update
+    """
+    if before.permissions != after.permissions:
+        clear_guild_admin_cache(after.guild.id)
+
+@bot.event
+async def on_guild_role_delete(role):
+    """
+    Event handler triggered when a role is deleted
+    
+    Members may have held administrator only through this role, so all
+    cached checks for the guild are dropped.
+    
+    Parameters:
+        role: The deleted role
+    """
+    clear_guild_admin_cache(role.guild.id)
+
+@bot.event
+async def on_guild_update(before, after):
+    """
+    Event handler triggered when a guild's settings change
+    
+    The owner always counts as an administrator, so a transfer of
+    ownership drops all cached checks for the guild.
+    
+    Parameters:
+        before: The guild before the update
+        after: The guild after the update
+    """
+    if before.owner_id != after.owner_id:
+        clear_guild_admin_cache(after.id)
 
 # Event listener for bans
 # This could be expanded to implement automatic ban synchronization
@@ -561,7 +1085,18 @@ async def on_member_ban(guild, user):
 
 # Run the bot
 if __name__ == "__main__":
+    token = os.environ.get("DISCORD_TOKEN")
+    if not token:
+        raise SystemExit("Set the DISCORD_TOKEN environment variable to your Discord bot token")
+    
+    # uvloop gives the event loop lower per-task overhead for the concurrent ban fan-out
+    # It isn't available on Windows, where the default asyncio loop is used instead
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     print("Starting Ban Sync Bot...")
-    print("Make sure to replace 'YOUR_BOT_TOKEN' with your actual Discord bot token")
     # The bot.run() method is blocking and will not return until the bot is shut down
-    bot.run("YOUR_BOT_TOKEN")  # Replace with your actual bot token
+    bot.run(token)